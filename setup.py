@@ -90,7 +90,7 @@ def get_include_files() -> List[Tuple[str, str]]:
     entry_points={"console_scripts": ["sslyze = sslyze.__main__:main"]},
     # Dependencies
     install_requires=[
-        "nassl>=4.0.0,<5.0.0",
+        "nassl==4.0.2",
         "cryptography>=2.6,<3.4",
         "tls-parser>=1.2.2,<1.3.0",
         "typing_extensions ; python_version<'3.8'",  # To remove when we drop support for Python 3.7
@@ -0,0 +1,549 @@
+# This file was generated by tools/generate_cipher_suites.py with nassl 4.0.2; do not edit it manually
+# It is only valid for nassl 4.0.2, which is pinned in setup.py, Pipfile and Pipfile.lock; when bumping nassl,
+# update the pin everywhere and regenerate this file with `invoke gen-cipher-suites` in the same commit
+from typing import Dict, Tuple
+
+from sslyze.server_connectivity import TlsVersionEnum
+
+
+# The OpenSSL names of the cipher suites supported by nassl for each version of SSL/TLS, except TLS 1.3
+OPENSSL_CIPHER_SUITE_NAMES: Dict[TlsVersionEnum, Tuple[str, ...]] = {
+    TlsVersionEnum.SSL_2_0: (
+        "DES-CBC-MD5",
+        "DES-CBC3-MD5",
+        "EXP-RC2-CBC-MD5",
+        "EXP-RC4-MD5",
+        "IDEA-CBC-MD5",
+        "RC2-CBC-MD5",
+        "RC4-MD5",
+    ),
+    TlsVersionEnum.SSL_3_0: (
+        "ADH-AES128-GCM-SHA256",
+        "ADH-AES128-SHA",
+        "ADH-AES128-SHA256",
+        "ADH-AES256-GCM-SHA384",
+        "ADH-AES256-SHA",
+        "ADH-AES256-SHA256",
+        "ADH-CAMELLIA128-SHA",
+        "ADH-CAMELLIA256-SHA",
+        "ADH-DES-CBC-SHA",
+        "ADH-DES-CBC3-SHA",
+        "ADH-RC4-MD5",
+        "ADH-SEED-SHA",
+        "AECDH-AES128-SHA",
+        "AECDH-AES256-SHA",
+        "AECDH-DES-CBC3-SHA",
+        "AECDH-NULL-SHA",
+        "AECDH-RC4-SHA",
+        "AES128-GCM-SHA256",
+        "AES128-SHA",
+        "AES128-SHA256",
+        "AES256-GCM-SHA384",
+        "AES256-SHA",
+        "AES256-SHA256",
+        "CAMELLIA128-SHA",
+        "CAMELLIA256-SHA",
+        "DES-CBC-SHA",
+        "DES-CBC3-SHA",
+        "DH-DSS-AES128-GCM-SHA256",
+        "DH-DSS-AES128-SHA",
+        "DH-DSS-AES128-SHA256",
+        "DH-DSS-AES256-GCM-SHA384",
+        "DH-DSS-AES256-SHA",
+        "DH-DSS-AES256-SHA256",
+        "DH-DSS-CAMELLIA128-SHA",
+        "DH-DSS-CAMELLIA256-SHA",
+        "DH-DSS-DES-CBC-SHA",
+        "DH-DSS-DES-CBC3-SHA",
+        "DH-DSS-SEED-SHA",
+        "DH-RSA-AES128-GCM-SHA256",
+        "DH-RSA-AES128-SHA",
+        "DH-RSA-AES128-SHA256",
+        "DH-RSA-AES256-GCM-SHA384",
+        "DH-RSA-AES256-SHA",
+        "DH-RSA-AES256-SHA256",
+        "DH-RSA-CAMELLIA128-SHA",
+        "DH-RSA-CAMELLIA256-SHA",
+        "DH-RSA-DES-CBC-SHA",
+        "DH-RSA-DES-CBC3-SHA",
+        "DH-RSA-SEED-SHA",
+        "DHE-DSS-AES128-GCM-SHA256",
+        "DHE-DSS-AES128-SHA",
+        "DHE-DSS-AES128-SHA256",
+        "DHE-DSS-AES256-GCM-SHA384",
+        "DHE-DSS-AES256-SHA",
+        "DHE-DSS-AES256-SHA256",
+        "DHE-DSS-CAMELLIA128-SHA",
+        "DHE-DSS-CAMELLIA256-SHA",
+        "DHE-DSS-SEED-SHA",
+        "DHE-RSA-AES128-GCM-SHA256",
+        "DHE-RSA-AES128-SHA",
+        "DHE-RSA-AES128-SHA256",
+        "DHE-RSA-AES256-GCM-SHA384",
+        "DHE-RSA-AES256-SHA",
+        "DHE-RSA-AES256-SHA256",
+        "DHE-RSA-CAMELLIA128-SHA",
+        "DHE-RSA-CAMELLIA256-SHA",
+        "DHE-RSA-SEED-SHA",
+        "ECDH-ECDSA-AES128-GCM-SHA256",
+        "ECDH-ECDSA-AES128-SHA",
+        "ECDH-ECDSA-AES128-SHA256",
+        "ECDH-ECDSA-AES256-GCM-SHA384",
+        "ECDH-ECDSA-AES256-SHA",
+        "ECDH-ECDSA-AES256-SHA384",
+        "ECDH-ECDSA-DES-CBC3-SHA",
+        "ECDH-ECDSA-NULL-SHA",
+        "ECDH-ECDSA-RC4-SHA",
+        "ECDH-RSA-AES128-GCM-SHA256",
+        "ECDH-RSA-AES128-SHA",
+        "ECDH-RSA-AES128-SHA256",
+        "ECDH-RSA-AES256-GCM-SHA384",
+        "ECDH-RSA-AES256-SHA",
+        "ECDH-RSA-AES256-SHA384",
+        "ECDH-RSA-DES-CBC3-SHA",
+        "ECDH-RSA-NULL-SHA",
+        "ECDH-RSA-RC4-SHA",
+        "ECDHE-ECDSA-AES128-GCM-SHA256",
+        "ECDHE-ECDSA-AES128-SHA",
+        "ECDHE-ECDSA-AES128-SHA256",
+        "ECDHE-ECDSA-AES256-GCM-SHA384",
+        "ECDHE-ECDSA-AES256-SHA",
+        "ECDHE-ECDSA-AES256-SHA384",
+        "ECDHE-ECDSA-DES-CBC3-SHA",
+        "ECDHE-ECDSA-NULL-SHA",
+        "ECDHE-ECDSA-RC4-SHA",
+        "ECDHE-RSA-AES128-GCM-SHA256",
+        "ECDHE-RSA-AES128-SHA",
+        "ECDHE-RSA-AES128-SHA256",
+        "ECDHE-RSA-AES256-GCM-SHA384",
+        "ECDHE-RSA-AES256-SHA",
+        "ECDHE-RSA-AES256-SHA384",
+        "ECDHE-RSA-DES-CBC3-SHA",
+        "ECDHE-RSA-NULL-SHA",
+        "ECDHE-RSA-RC4-SHA",
+        "EDH-DSS-DES-CBC-SHA",
+        "EDH-DSS-DES-CBC3-SHA",
+        "EDH-RSA-DES-CBC-SHA",
+        "EDH-RSA-DES-CBC3-SHA",
+        "EXP-ADH-DES-CBC-SHA",
+        "EXP-ADH-RC4-MD5",
+        "EXP-DES-CBC-SHA",
+        "EXP-EDH-DSS-DES-CBC-SHA",
+        "EXP-EDH-RSA-DES-CBC-SHA",
+        "EXP-RC2-CBC-MD5",
+        "EXP-RC4-MD5",
+        "IDEA-CBC-SHA",
+        "NULL-MD5",
+        "NULL-SHA",
+        "NULL-SHA256",
+        "RC4-MD5",
+        "RC4-SHA",
+        "SEED-SHA",
+    ),
+    TlsVersionEnum.TLS_1_0: (
+        "ADH-AES128-GCM-SHA256",
+        "ADH-AES128-SHA",
+        "ADH-AES128-SHA256",
+        "ADH-AES256-GCM-SHA384",
+        "ADH-AES256-SHA",
+        "ADH-AES256-SHA256",
+        "ADH-CAMELLIA128-SHA",
+        "ADH-CAMELLIA256-SHA",
+        "ADH-DES-CBC-SHA",
+        "ADH-DES-CBC3-SHA",
+        "ADH-RC4-MD5",
+        "ADH-SEED-SHA",
+        "AECDH-AES128-SHA",
+        "AECDH-AES256-SHA",
+        "AECDH-DES-CBC3-SHA",
+        "AECDH-NULL-SHA",
+        "AECDH-RC4-SHA",
+        "AES128-GCM-SHA256",
+        "AES128-SHA",
+        "AES128-SHA256",
+        "AES256-GCM-SHA384",
+        "AES256-SHA",
+        "AES256-SHA256",
+        "CAMELLIA128-SHA",
+        "CAMELLIA256-SHA",
+        "DES-CBC-SHA",
+        "DES-CBC3-SHA",
+        "DH-DSS-AES128-GCM-SHA256",
+        "DH-DSS-AES128-SHA",
+        "DH-DSS-AES128-SHA256",
+        "DH-DSS-AES256-GCM-SHA384",
+        "DH-DSS-AES256-SHA",
+        "DH-DSS-AES256-SHA256",
+        "DH-DSS-CAMELLIA128-SHA",
+        "DH-DSS-CAMELLIA256-SHA",
+        "DH-DSS-DES-CBC-SHA",
+        "DH-DSS-DES-CBC3-SHA",
+        "DH-DSS-SEED-SHA",
+        "DH-RSA-AES128-GCM-SHA256",
+        "DH-RSA-AES128-SHA",
+        "DH-RSA-AES128-SHA256",
+        "DH-RSA-AES256-GCM-SHA384",
+        "DH-RSA-AES256-SHA",
+        "DH-RSA-AES256-SHA256",
+        "DH-RSA-CAMELLIA128-SHA",
+        "DH-RSA-CAMELLIA256-SHA",
+        "DH-RSA-DES-CBC-SHA",
+        "DH-RSA-DES-CBC3-SHA",
+        "DH-RSA-SEED-SHA",
+        "DHE-DSS-AES128-GCM-SHA256",
+        "DHE-DSS-AES128-SHA",
+        "DHE-DSS-AES128-SHA256",
+        "DHE-DSS-AES256-GCM-SHA384",
+        "DHE-DSS-AES256-SHA",
+        "DHE-DSS-AES256-SHA256",
+        "DHE-DSS-CAMELLIA128-SHA",
+        "DHE-DSS-CAMELLIA256-SHA",
+        "DHE-DSS-SEED-SHA",
+        "DHE-RSA-AES128-GCM-SHA256",
+        "DHE-RSA-AES128-SHA",
+        "DHE-RSA-AES128-SHA256",
+        "DHE-RSA-AES256-GCM-SHA384",
+        "DHE-RSA-AES256-SHA",
+        "DHE-RSA-AES256-SHA256",
+        "DHE-RSA-CAMELLIA128-SHA",
+        "DHE-RSA-CAMELLIA256-SHA",
+        "DHE-RSA-SEED-SHA",
+        "ECDH-ECDSA-AES128-GCM-SHA256",
+        "ECDH-ECDSA-AES128-SHA",
+        "ECDH-ECDSA-AES128-SHA256",
+        "ECDH-ECDSA-AES256-GCM-SHA384",
+        "ECDH-ECDSA-AES256-SHA",
+        "ECDH-ECDSA-AES256-SHA384",
+        "ECDH-ECDSA-DES-CBC3-SHA",
+        "ECDH-ECDSA-NULL-SHA",
+        "ECDH-ECDSA-RC4-SHA",
+        "ECDH-RSA-AES128-GCM-SHA256",
+        "ECDH-RSA-AES128-SHA",
+        "ECDH-RSA-AES128-SHA256",
+        "ECDH-RSA-AES256-GCM-SHA384",
+        "ECDH-RSA-AES256-SHA",
+        "ECDH-RSA-AES256-SHA384",
+        "ECDH-RSA-DES-CBC3-SHA",
+        "ECDH-RSA-NULL-SHA",
+        "ECDH-RSA-RC4-SHA",
+        "ECDHE-ECDSA-AES128-GCM-SHA256",
+        "ECDHE-ECDSA-AES128-SHA",
+        "ECDHE-ECDSA-AES128-SHA256",
+        "ECDHE-ECDSA-AES256-GCM-SHA384",
+        "ECDHE-ECDSA-AES256-SHA",
+        "ECDHE-ECDSA-AES256-SHA384",
+        "ECDHE-ECDSA-DES-CBC3-SHA",
+        "ECDHE-ECDSA-NULL-SHA",
+        "ECDHE-ECDSA-RC4-SHA",
+        "ECDHE-RSA-AES128-GCM-SHA256",
+        "ECDHE-RSA-AES128-SHA",
+        "ECDHE-RSA-AES128-SHA256",
+        "ECDHE-RSA-AES256-GCM-SHA384",
+        "ECDHE-RSA-AES256-SHA",
+        "ECDHE-RSA-AES256-SHA384",
+        "ECDHE-RSA-DES-CBC3-SHA",
+        "ECDHE-RSA-NULL-SHA",
+        "ECDHE-RSA-RC4-SHA",
+        "EDH-DSS-DES-CBC-SHA",
+        "EDH-DSS-DES-CBC3-SHA",
+        "EDH-RSA-DES-CBC-SHA",
+        "EDH-RSA-DES-CBC3-SHA",
+        "EXP-ADH-DES-CBC-SHA",
+        "EXP-ADH-RC4-MD5",
+        "EXP-DES-CBC-SHA",
+        "EXP-EDH-DSS-DES-CBC-SHA",
+        "EXP-EDH-RSA-DES-CBC-SHA",
+        "EXP-RC2-CBC-MD5",
+        "EXP-RC4-MD5",
+        "IDEA-CBC-SHA",
+        "NULL-MD5",
+        "NULL-SHA",
+        "NULL-SHA256",
+        "RC4-MD5",
+        "RC4-SHA",
+        "SEED-SHA",
+    ),
+    TlsVersionEnum.TLS_1_1: (
+        "ADH-AES128-GCM-SHA256",
+        "ADH-AES128-SHA",
+        "ADH-AES128-SHA256",
+        "ADH-AES256-GCM-SHA384",
+        "ADH-AES256-SHA",
+        "ADH-AES256-SHA256",
+        "ADH-CAMELLIA128-SHA",
+        "ADH-CAMELLIA256-SHA",
+        "ADH-DES-CBC-SHA",
+        "ADH-DES-CBC3-SHA",
+        "ADH-RC4-MD5",
+        "ADH-SEED-SHA",
+        "AECDH-AES128-SHA",
+        "AECDH-AES256-SHA",
+        "AECDH-DES-CBC3-SHA",
+        "AECDH-NULL-SHA",
+        "AECDH-RC4-SHA",
+        "AES128-GCM-SHA256",
+        "AES128-SHA",
+        "AES128-SHA256",
+        "AES256-GCM-SHA384",
+        "AES256-SHA",
+        "AES256-SHA256",
+        "CAMELLIA128-SHA",
+        "CAMELLIA256-SHA",
+        "DES-CBC-SHA",
+        "DES-CBC3-SHA",
+        "DH-DSS-AES128-GCM-SHA256",
+        "DH-DSS-AES128-SHA",
+        "DH-DSS-AES128-SHA256",
+        "DH-DSS-AES256-GCM-SHA384",
+        "DH-DSS-AES256-SHA",
+        "DH-DSS-AES256-SHA256",
+        "DH-DSS-CAMELLIA128-SHA",
+        "DH-DSS-CAMELLIA256-SHA",
+        "DH-DSS-DES-CBC-SHA",
+        "DH-DSS-DES-CBC3-SHA",
+        "DH-DSS-SEED-SHA",
+        "DH-RSA-AES128-GCM-SHA256",
+        "DH-RSA-AES128-SHA",
+        "DH-RSA-AES128-SHA256",
+        "DH-RSA-AES256-GCM-SHA384",
+        "DH-RSA-AES256-SHA",
+        "DH-RSA-AES256-SHA256",
+        "DH-RSA-CAMELLIA128-SHA",
+        "DH-RSA-CAMELLIA256-SHA",
+        "DH-RSA-DES-CBC-SHA",
+        "DH-RSA-DES-CBC3-SHA",
+        "DH-RSA-SEED-SHA",
+        "DHE-DSS-AES128-GCM-SHA256",
+        "DHE-DSS-AES128-SHA",
+        "DHE-DSS-AES128-SHA256",
+        "DHE-DSS-AES256-GCM-SHA384",
+        "DHE-DSS-AES256-SHA",
+        "DHE-DSS-AES256-SHA256",
+        "DHE-DSS-CAMELLIA128-SHA",
+        "DHE-DSS-CAMELLIA256-SHA",
+        "DHE-DSS-SEED-SHA",
+        "DHE-RSA-AES128-GCM-SHA256",
+        "DHE-RSA-AES128-SHA",
+        "DHE-RSA-AES128-SHA256",
+        "DHE-RSA-AES256-GCM-SHA384",
+        "DHE-RSA-AES256-SHA",
+        "DHE-RSA-AES256-SHA256",
+        "DHE-RSA-CAMELLIA128-SHA",
+        "DHE-RSA-CAMELLIA256-SHA",
+        "DHE-RSA-SEED-SHA",
+        "ECDH-ECDSA-AES128-GCM-SHA256",
+        "ECDH-ECDSA-AES128-SHA",
+        "ECDH-ECDSA-AES128-SHA256",
+        "ECDH-ECDSA-AES256-GCM-SHA384",
+        "ECDH-ECDSA-AES256-SHA",
+        "ECDH-ECDSA-AES256-SHA384",
+        "ECDH-ECDSA-DES-CBC3-SHA",
+        "ECDH-ECDSA-NULL-SHA",
+        "ECDH-ECDSA-RC4-SHA",
+        "ECDH-RSA-AES128-GCM-SHA256",
+        "ECDH-RSA-AES128-SHA",
+        "ECDH-RSA-AES128-SHA256",
+        "ECDH-RSA-AES256-GCM-SHA384",
+        "ECDH-RSA-AES256-SHA",
+        "ECDH-RSA-AES256-SHA384",
+        "ECDH-RSA-DES-CBC3-SHA",
+        "ECDH-RSA-NULL-SHA",
+        "ECDH-RSA-RC4-SHA",
+        "ECDHE-ECDSA-AES128-GCM-SHA256",
+        "ECDHE-ECDSA-AES128-SHA",
+        "ECDHE-ECDSA-AES128-SHA256",
+        "ECDHE-ECDSA-AES256-GCM-SHA384",
+        "ECDHE-ECDSA-AES256-SHA",
+        "ECDHE-ECDSA-AES256-SHA384",
+        "ECDHE-ECDSA-DES-CBC3-SHA",
+        "ECDHE-ECDSA-NULL-SHA",
+        "ECDHE-ECDSA-RC4-SHA",
+        "ECDHE-RSA-AES128-GCM-SHA256",
+        "ECDHE-RSA-AES128-SHA",
+        "ECDHE-RSA-AES128-SHA256",
+        "ECDHE-RSA-AES256-GCM-SHA384",
+        "ECDHE-RSA-AES256-SHA",
+        "ECDHE-RSA-AES256-SHA384",
+        "ECDHE-RSA-DES-CBC3-SHA",
+        "ECDHE-RSA-NULL-SHA",
+        "ECDHE-RSA-RC4-SHA",
+        "EDH-DSS-DES-CBC-SHA",
+        "EDH-DSS-DES-CBC3-SHA",
+        "EDH-RSA-DES-CBC-SHA",
+        "EDH-RSA-DES-CBC3-SHA",
+        "EXP-ADH-DES-CBC-SHA",
+        "EXP-ADH-RC4-MD5",
+        "EXP-DES-CBC-SHA",
+        "EXP-EDH-DSS-DES-CBC-SHA",
+        "EXP-EDH-RSA-DES-CBC-SHA",
+        "EXP-RC2-CBC-MD5",
+        "EXP-RC4-MD5",
+        "IDEA-CBC-SHA",
+        "NULL-MD5",
+        "NULL-SHA",
+        "NULL-SHA256",
+        "RC4-MD5",
+        "RC4-SHA",
+        "SEED-SHA",
+    ),
+    TlsVersionEnum.TLS_1_2: (
+        "ADH-AES128-GCM-SHA256",
+        "ADH-AES128-SHA",
+        "ADH-AES128-SHA256",
+        "ADH-AES256-GCM-SHA384",
+        "ADH-AES256-SHA",
+        "ADH-AES256-SHA256",
+        "ADH-CAMELLIA128-SHA",
+        "ADH-CAMELLIA128-SHA256",
+        "ADH-CAMELLIA256-SHA",
+        "ADH-CAMELLIA256-SHA256",
+        "ADH-DES-CBC-SHA",
+        "ADH-DES-CBC3-SHA",
+        "ADH-RC4-MD5",
+        "ADH-SEED-SHA",
+        "AECDH-AES128-SHA",
+        "AECDH-AES256-SHA",
+        "AECDH-DES-CBC3-SHA",
+        "AECDH-NULL-SHA",
+        "AECDH-RC4-SHA",
+        "AES128-CCM",
+        "AES128-CCM8",
+        "AES128-GCM-SHA256",
+        "AES128-SHA",
+        "AES128-SHA256",
+        "AES256-CCM",
+        "AES256-CCM8",
+        "AES256-GCM-SHA384",
+        "AES256-SHA",
+        "AES256-SHA256",
+        "ARIA128-GCM-SHA256",
+        "ARIA256-GCM-SHA384",
+        "CAMELLIA128-SHA",
+        "CAMELLIA128-SHA256",
+        "CAMELLIA256-SHA",
+        "CAMELLIA256-SHA256",
+        "DES-CBC-SHA",
+        "DES-CBC3-SHA",
+        "DH-DSS-AES128-GCM-SHA256",
+        "DH-DSS-AES128-SHA",
+        "DH-DSS-AES128-SHA256",
+        "DH-DSS-AES256-GCM-SHA384",
+        "DH-DSS-AES256-SHA",
+        "DH-DSS-AES256-SHA256",
+        "DH-DSS-CAMELLIA128-SHA",
+        "DH-DSS-CAMELLIA256-SHA",
+        "DH-DSS-DES-CBC-SHA",
+        "DH-DSS-DES-CBC3-SHA",
+        "DH-DSS-SEED-SHA",
+        "DH-RSA-AES128-GCM-SHA256",
+        "DH-RSA-AES128-SHA",
+        "DH-RSA-AES128-SHA256",
+        "DH-RSA-AES256-GCM-SHA384",
+        "DH-RSA-AES256-SHA",
+        "DH-RSA-AES256-SHA256",
+        "DH-RSA-CAMELLIA128-SHA",
+        "DH-RSA-CAMELLIA256-SHA",
+        "DH-RSA-DES-CBC-SHA",
+        "DH-RSA-DES-CBC3-SHA",
+        "DH-RSA-SEED-SHA",
+        "DHE-DSS-AES128-GCM-SHA256",
+        "DHE-DSS-AES128-SHA",
+        "DHE-DSS-AES128-SHA256",
+        "DHE-DSS-AES256-GCM-SHA384",
+        "DHE-DSS-AES256-SHA",
+        "DHE-DSS-AES256-SHA256",
+        "DHE-DSS-ARIA128-GCM-SHA256",
+        "DHE-DSS-ARIA256-GCM-SHA384",
+        "DHE-DSS-CAMELLIA128-SHA",
+        "DHE-DSS-CAMELLIA128-SHA256",
+        "DHE-DSS-CAMELLIA256-SHA",
+        "DHE-DSS-CAMELLIA256-SHA256",
+        "DHE-DSS-DES-CBC3-SHA",
+        "DHE-DSS-SEED-SHA",
+        "DHE-RSA-AES128-CCM",
+        "DHE-RSA-AES128-CCM8",
+        "DHE-RSA-AES128-GCM-SHA256",
+        "DHE-RSA-AES128-SHA",
+        "DHE-RSA-AES128-SHA256",
+        "DHE-RSA-AES256-CCM",
+        "DHE-RSA-AES256-CCM8",
+        "DHE-RSA-AES256-GCM-SHA384",
+        "DHE-RSA-AES256-SHA",
+        "DHE-RSA-AES256-SHA256",
+        "DHE-RSA-ARIA128-GCM-SHA256",
+        "DHE-RSA-ARIA256-GCM-SHA384",
+        "DHE-RSA-CAMELLIA128-SHA",
+        "DHE-RSA-CAMELLIA128-SHA256",
+        "DHE-RSA-CAMELLIA256-SHA",
+        "DHE-RSA-CAMELLIA256-SHA256",
+        "DHE-RSA-CHACHA20-POLY1305",
+        "DHE-RSA-DES-CBC3-SHA",
+        "DHE-RSA-SEED-SHA",
+        "ECDH-ECDSA-AES128-GCM-SHA256",
+        "ECDH-ECDSA-AES128-SHA",
+        "ECDH-ECDSA-AES128-SHA256",
+        "ECDH-ECDSA-AES256-GCM-SHA384",
+        "ECDH-ECDSA-AES256-SHA",
+        "ECDH-ECDSA-AES256-SHA384",
+        "ECDH-ECDSA-DES-CBC3-SHA",
+        "ECDH-ECDSA-NULL-SHA",
+        "ECDH-ECDSA-RC4-SHA",
+        "ECDH-RSA-AES128-GCM-SHA256",
+        "ECDH-RSA-AES128-SHA",
+        "ECDH-RSA-AES128-SHA256",
+        "ECDH-RSA-AES256-GCM-SHA384",
+        "ECDH-RSA-AES256-SHA",
+        "ECDH-RSA-AES256-SHA384",
+        "ECDH-RSA-DES-CBC3-SHA",
+        "ECDH-RSA-NULL-SHA",
+        "ECDH-RSA-RC4-SHA",
+        "ECDHE-ARIA128-GCM-SHA256",
+        "ECDHE-ARIA256-GCM-SHA384",
+        "ECDHE-ECDSA-AES128-CCM",
+        "ECDHE-ECDSA-AES128-CCM8",
+        "ECDHE-ECDSA-AES128-GCM-SHA256",
+        "ECDHE-ECDSA-AES128-SHA",
+        "ECDHE-ECDSA-AES128-SHA256",
+        "ECDHE-ECDSA-AES256-CCM",
+        "ECDHE-ECDSA-AES256-CCM8",
+        "ECDHE-ECDSA-AES256-GCM-SHA384",
+        "ECDHE-ECDSA-AES256-SHA",
+        "ECDHE-ECDSA-AES256-SHA384",
+        "ECDHE-ECDSA-ARIA128-GCM-SHA256",
+        "ECDHE-ECDSA-ARIA256-GCM-SHA384",
+        "ECDHE-ECDSA-CAMELLIA128-SHA256",
+        "ECDHE-ECDSA-CAMELLIA256-SHA384",
+        "ECDHE-ECDSA-CHACHA20-POLY1305",
+        "ECDHE-ECDSA-DES-CBC3-SHA",
+        "ECDHE-ECDSA-NULL-SHA",
+        "ECDHE-ECDSA-RC4-SHA",
+        "ECDHE-RSA-AES128-GCM-SHA256",
+        "ECDHE-RSA-AES128-SHA",
+        "ECDHE-RSA-AES128-SHA256",
+        "ECDHE-RSA-AES256-GCM-SHA384",
+        "ECDHE-RSA-AES256-SHA",
+        "ECDHE-RSA-AES256-SHA384",
+        "ECDHE-RSA-CAMELLIA128-SHA256",
+        "ECDHE-RSA-CAMELLIA256-SHA384",
+        "ECDHE-RSA-CHACHA20-POLY1305",
+        "ECDHE-RSA-DES-CBC3-SHA",
+        "ECDHE-RSA-NULL-SHA",
+        "ECDHE-RSA-RC4-SHA",
+        "EDH-DSS-DES-CBC-SHA",
+        "EDH-RSA-DES-CBC-SHA",
+        "EXP-ADH-DES-CBC-SHA",
+        "EXP-ADH-RC4-MD5",
+        "EXP-DES-CBC-SHA",
+        "EXP-EDH-DSS-DES-CBC-SHA",
+        "EXP-EDH-RSA-DES-CBC-SHA",
+        "EXP-RC2-CBC-MD5",
+        "EXP-RC4-MD5",
+        "IDEA-CBC-SHA",
+        "NULL-MD5",
+        "NULL-SHA",
+        "NULL-SHA256",
+        "RC4-MD5",
+        "RC4-SHA",
+        "SEED-SHA",
+    ),
+}
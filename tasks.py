@@ -29,6 +29,15 @@ def gen_doc(ctx):
     ctx.run(f"python -m sphinx -v -b html {docs_folder_path} {dst_path}")
 
 
+@task
+def gen_cipher_suites(ctx):
+    # type: (Context) -> None
+    # Has to be run every time the version of nassl changes: the cipher suites are only valid for the exact version of
+    # nassl they were generated with, which is why nassl is pinned in setup.py, Pipfile and Pipfile.lock; bumping nassl
+    # means updating the pin everywhere and regenerating the file in the same commit
+    ctx.run("python tools/generate_cipher_suites.py", env={"PYTHONPATH": str(root_path)})
+
+
 @task
 def release(ctx):
     # type: (Context) -> None
@@ -40,6 +49,9 @@ def release(ctx):
     # Ensure the tests pass
     test(ctx)
 
+    # Ensure the list of cipher suites matches the version of nassl
+    ctx.run("python tools/generate_cipher_suites.py --check", env={"PYTHONPATH": str(root_path)})
+
     # Ensure the API samples work
     ctx.run("python api_sample.py")
 
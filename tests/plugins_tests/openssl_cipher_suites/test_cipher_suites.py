@@ -1,7 +1,17 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
 from sslyze.plugins.openssl_cipher_suites.cipher_suites import CipherSuitesRepository
 from sslyze.server_connectivity import TlsVersionEnum
 
 
+_ROOT_PATH = Path(__file__).parent.parent.parent.parent.absolute()
+
+
 class TestCipherSuiteMappings:
     def test_names_mapping_legacy_ssl_client(self):
         for tls_version, expected_cipher_suites_count in [
@@ -18,3 +28,28 @@ def test_names_mapping_legacy_ssl_client(self):
                 assert cipher_suite.name
                 assert cipher_suite.key_size is not None
                 assert cipher_suite.is_anonymous is not None
+
+    def test_cipher_suites_match_nassl(self):
+        # The cipher suites were generated in advance with tools/generate_cipher_suites.py; make sure they are still the
+        # ones supported by the installed nassl by running the generator itself
+        result = subprocess.run(
+            [sys.executable, str(_ROOT_PATH / "tools" / "generate_cipher_suites.py"), "--check"],
+            env={**os.environ, "PYTHONPATH": str(_ROOT_PATH)},
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+        )
+        assert result.returncode == 0, result.stdout
+
+    def test_get_cipher_suite_with_openssl_name(self):
+        cipher_suite = CipherSuitesRepository.get_cipher_suite_with_openssl_name(
+            TlsVersionEnum.TLS_1_2, "ECDHE-RSA-AES128-GCM-SHA256"
+        )
+        assert cipher_suite.name == "TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256"
+        assert cipher_suite.openssl_name == "ECDHE-RSA-AES128-GCM-SHA256"
+        assert cipher_suite.key_size == 128
+        assert not cipher_suite.is_anonymous
+
+    def test_get_cipher_suite_with_openssl_name_unknown_name(self):
+        with pytest.raises(ValueError):
+            CipherSuitesRepository.get_cipher_suite_with_openssl_name(TlsVersionEnum.TLS_1_2, "NOT-A-CIPHER-SUITE")
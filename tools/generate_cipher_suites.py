@@ -0,0 +1,129 @@
+"""Generate the list of cipher suites supported by nassl's legacy and modern OpenSSL for each version of SSL/TLS.
+
+The list only changes when the version of nassl (and therefore of OpenSSL) used by sslyze changes; it is saved to
+sslyze/plugins/openssl_cipher_suites/_cipher_suites_data.py so that sslyze does not have to query OpenSSL at runtime.
+As the saved list is only valid for the version of nassl it was generated with, nassl is pinned to that exact version
+in setup.py, Pipfile and Pipfile.lock; bumping nassl means updating the pin and regenerating the file together.
+
+Usage, from the root of the repository:
+
+    $ PYTHONPATH=. python tools/generate_cipher_suites.py [--check]
+
+With --check, the file is not written and the script fails if it is not up to date with the installed nassl.
+"""
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Dict, List, Set
+
+from nassl import __version__ as nassl_version
+from nassl.legacy_ssl_client import LegacySslClient
+from nassl.ssl_client import OpenSslVersionEnum, SslClient
+
+from sslyze.plugins.openssl_cipher_suites.cipher_suites import _TLS_1_3_CIPHER_SUITES, _get_openssl_names_mapping
+from sslyze.server_connectivity import TlsVersionEnum
+
+
+root_path = Path(__file__).parent.parent.absolute()
+_CIPHER_SUITES_DATA_PATH = root_path / "sslyze" / "plugins" / "openssl_cipher_suites" / "_cipher_suites_data.py"
+
+_TLS_1_3_CIPHER_SUITE_SET = frozenset(_TLS_1_3_CIPHER_SUITES)
+
+
+def _parse_all_cipher_suites_with_legacy_openssl(tls_version: TlsVersionEnum) -> Set[str]:
+    ssl_client = LegacySslClient(ssl_version=OpenSslVersionEnum(tls_version.value))
+    # Disable SRP and PSK cipher suites as they need a special setup in the client and are never used
+    ssl_client.set_cipher_list("ALL:COMPLEMENTOFALL:-PSK:-SRP")
+    return set(ssl_client.get_cipher_list())
+
+
+def _parse_tls_1_2_cipher_suites() -> Set[str]:
+    # For TLS 1.2, we have to use both the legacy and modern OpenSSL to cover all cipher suites
+    cipher_suites_from_legacy_openssl = _parse_all_cipher_suites_with_legacy_openssl(TlsVersionEnum.TLS_1_2)
+
+    ssl_client_modern = SslClient(ssl_version=OpenSslVersionEnum(TlsVersionEnum.TLS_1_2.value))
+    ssl_client_modern.set_cipher_list("ALL:COMPLEMENTOFALL:-PSK:-SRP")
+    cipher_suites_from_modern_openssl = set(ssl_client_modern.get_cipher_list())
+
+    # Combine the two sets of cipher suites and ignore TLS 1.3 cipher suites
+    openssl_cipher_strings = cipher_suites_from_legacy_openssl | cipher_suites_from_modern_openssl
+    openssl_cipher_strings -= _TLS_1_3_CIPHER_SUITE_SET
+
+    # Ignore cipher suite that is defined twice in OpenSSLL DHE-RSA-DES-CBC3-SHA and EDH-RSA-DES-CBC3-SHA
+    openssl_cipher_strings.discard("EDH-RSA-DES-CBC3-SHA")
+    return openssl_cipher_strings
+
+
+def _parse_all_cipher_suites() -> Dict[TlsVersionEnum, List[str]]:
+    tls_version_to_cipher_suites: Dict[TlsVersionEnum, List[str]] = {}
+    for tls_version in [
+        TlsVersionEnum.SSL_2_0,
+        TlsVersionEnum.SSL_3_0,
+        TlsVersionEnum.TLS_1_0,
+        TlsVersionEnum.TLS_1_1,
+        TlsVersionEnum.TLS_1_2,
+    ]:
+        if tls_version == TlsVersionEnum.TLS_1_2:
+            openssl_cipher_strings = _parse_tls_1_2_cipher_suites()
+        else:
+            openssl_cipher_strings = _parse_all_cipher_suites_with_legacy_openssl(tls_version)
+
+        # OpenSSL can have multiple names for the same cipher suite; only keep one name per cipher suite so that the
+        # generated list does not depend on the order in which the names were returned
+        openssl_names_mapping = _get_openssl_names_mapping(tls_version)
+        rfc_name_to_openssl_name: Dict[str, str] = {}
+        for cipher_suite_openssl_name in sorted(openssl_cipher_strings):
+            if cipher_suite_openssl_name not in openssl_names_mapping:
+                raise ValueError(
+                    f"No RFC name or key size for the {tls_version.name} cipher suite {cipher_suite_openssl_name}; add "
+                    f"it to the mappings in sslyze/plugins/openssl_cipher_suites/cipher_suites.py"
+                )
+            cipher_suite_rfc_name, _, _ = openssl_names_mapping[cipher_suite_openssl_name]
+            rfc_name_to_openssl_name.setdefault(cipher_suite_rfc_name, cipher_suite_openssl_name)
+
+        tls_version_to_cipher_suites[tls_version] = sorted(rfc_name_to_openssl_name.values())
+
+    return tls_version_to_cipher_suites
+
+
+def _generate_cipher_suites_data(tls_version_to_cipher_suites: Dict[TlsVersionEnum, List[str]]) -> str:
+    lines = [
+        f"# This file was generated by tools/generate_cipher_suites.py with nassl {nassl_version}; "
+        "do not edit it manually",
+        f"# It is only valid for nassl {nassl_version}, which is pinned in setup.py, Pipfile and Pipfile.lock; when "
+        "bumping nassl,",
+        "# update the pin everywhere and regenerate this file with `invoke gen-cipher-suites` in the same commit",
+        "from typing import Dict, Tuple",
+        "",
+        "from sslyze.server_connectivity import TlsVersionEnum",
+        "",
+        "",
+        "# The OpenSSL names of the cipher suites supported by nassl for each version of SSL/TLS, except TLS 1.3",
+        "OPENSSL_CIPHER_SUITE_NAMES: Dict[TlsVersionEnum, Tuple[str, ...]] = {",
+    ]
+    for tls_version, openssl_cipher_strings in tls_version_to_cipher_suites.items():
+        lines.append(f"    TlsVersionEnum.{tls_version.name}: (")
+        lines.extend(f'        "{cipher_suite_openssl_name}",' for cipher_suite_openssl_name in openssl_cipher_strings)
+        lines.append("    ),")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Generate the list of cipher suites supported by nassl.")
+    parser.add_argument("--check", action="store_true", help="Fail if the generated file is not up to date.")
+    args = parser.parse_args()
+
+    cipher_suites_data = _generate_cipher_suites_data(_parse_all_cipher_suites())
+    if args.check:
+        if _CIPHER_SUITES_DATA_PATH.read_text() != cipher_suites_data:
+            print(f"{_CIPHER_SUITES_DATA_PATH} is out of date; run tools/generate_cipher_suites.py")
+            sys.exit(1)
+        print(f"{_CIPHER_SUITES_DATA_PATH} is up to date")
+    else:
+        _CIPHER_SUITES_DATA_PATH.write_text(cipher_suites_data)
+        print(f"Generated {_CIPHER_SUITES_DATA_PATH}")
+
+
+if __name__ == "__main__":
+    main()